@@ -6,11 +6,22 @@ from pathlib import Path
 ENV_NAME = "data-analysis-proj"
 APP_MODULE = "src.app.app"
 
+# Marker file recording that the conda environment was seen once; its
+# presence lets later launches skip the slow `conda env list` subprocess.
+ENV_CHECK_CACHE = Path.home() / ".cache" / "data-analysis-proj" / "env.ok"
+
 
 def is_conda_env_created(env_name):
-    """Check if a conda environment exists."""
+    """Check if a conda environment exists, caching a positive result."""
+    if ENV_CHECK_CACHE.exists():
+        return True
+
     result = subprocess.run(["conda", "env", "list"], capture_output=True, text=True)
-    return env_name in result.stdout
+    if env_name in result.stdout:
+        ENV_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        ENV_CHECK_CACHE.touch()
+        return True
+    return False
 
 
 def create_conda_env():
@@ -35,6 +46,14 @@ def run_app_in_conda(env_name: str):
 
 
 if __name__ == "__main__":
+    if os.environ.get("CONDA_DEFAULT_ENV") == ENV_NAME:
+        # Already inside the target environment: run the app in-process
+        # instead of bootstrapping a second Python via `conda run`.
+        from src.app.app import MainApplication
+
+        MainApplication().mainloop()
+        sys.exit(0)
+
     if not is_conda_env_created(ENV_NAME):
         if not Path("environment.yml").exists():
             print("[ERROR] environment.yml file not found!")
@@ -6,6 +6,7 @@ from src.core import data_analysis as da
 from src.settings import config
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
 import threading
 
 
@@ -133,23 +134,13 @@ class SettingsFrame(tk.Frame):
         ]
 
         self.build_widgets()
+        self.load_values()
 
     def build_widgets(self):
         """
-        Build all widgets for settings interface.
+        Build all widgets for settings interface. Called once; the widgets are
+        bound to StringVars, so refresh only has to update the variables.
         """
-        config_data = config.load_config()
-        current_resolution = (
-            f"{config_data['window_size'][0]}x{config_data['window_size'][1]}"
-        )
-        self.salary_method_var.set(
-            config_data.get("salary_calculation_method", "average")
-        )
-        self.max_results_var.set(str(config_data.get("max_results_per_request", 10)))
-        self.top_regions_var.set(str(config_data.get("top_regions_count", 5)))
-        self.top_skills_var.set(str(config_data.get("top_skills_count", 5)))
-        self.window_size_var.set(current_resolution)
-
         start_y = 0.2
         step_y = 0.08
         label_x = 0.05
@@ -199,22 +190,33 @@ class SettingsFrame(tk.Frame):
             self, text="Back", command=lambda: self.controller.show_frame("MainMenu")
         ).place(relx=0.02, rely=0.98, relwidth=0.15, anchor="sw")
 
+    def load_values(self):
+        """
+        Restore current values from config into the bound variables.
+        """
+        settings = config.get_settings()
+        self.salary_method_var.set(settings.salary_calculation_method)
+        self.max_results_var.set(str(settings.max_results_per_request))
+        self.top_regions_var.set(str(settings.top_regions_count))
+        self.top_skills_var.set(str(settings.top_skills_count))
+        self.window_size_var.set(
+            f"{settings.window_size[0]}x{settings.window_size[1]}"
+        )
+
     def save_config(self):
         """
-        Save all configured settings to config.json.
+        Save all configured settings to config.json with a single write.
         """
         try:
-            config.save_config(
-                {
-                    "salary_calculation_method": self.salary_method_var.get(),
-                    "max_results_per_request": int(self.max_results_var.get()),
-                    "top_regions_count": int(self.top_regions_var.get()),
-                    "top_skills_count": int(self.top_skills_var.get()),
-                    "window_size": list(
-                        map(int, self.window_size_var.get().split("x"))
-                    ),
-                }
+            settings = config.get_settings()
+            settings.salary_calculation_method = self.salary_method_var.get()
+            settings.max_results_per_request = int(self.max_results_var.get())
+            settings.top_regions_count = int(self.top_regions_var.get())
+            settings.top_skills_count = int(self.top_skills_var.get())
+            settings.window_size = tuple(
+                map(int, self.window_size_var.get().split("x"))
             )
+            settings.save()
             messagebox.showinfo(
                 "Success",
                 "Settings saved. Please restart the app to apply window size.",
@@ -224,11 +226,9 @@ class SettingsFrame(tk.Frame):
 
     def refresh(self, **kwargs):
         """
-        Reload all widgets and restore current values from config.
+        Restore current values from config; the widgets themselves are reused.
         """
-        for widget in self.winfo_children():
-            widget.destroy()
-        self.build_widgets()
+        self.load_values()
 
 
 class ResultFrame(tk.Frame):
@@ -263,8 +263,14 @@ class ResultFrame(tk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-        self.scrollable_frame.bind("<Enter>", self._bind_mousewheel)
-        self.scrollable_frame.bind("<Leave>", self._unbind_mousewheel)
+        # Wheel events go to the widget under the cursor, and the canvas is
+        # covered by scrollable_frame and its children, so a plain canvas
+        # binding would never fire. Bind globally once instead of churning
+        # bind_all/unbind_all on every enter/leave; the handler checks that
+        # the pointer is actually over the results area before scrolling.
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
 
         self.bottom_frame = tk.Frame(self, bg="white", height=60)
         self.bottom_frame.pack(side="bottom", fill="x")
@@ -276,113 +282,293 @@ class ResultFrame(tk.Frame):
         )
         self.back_btn.pack(pady=10)
 
-    def _bind_mousewheel(self, event):
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
-    def _unbind_mousewheel(self, event):
-        self.canvas.unbind_all("<MouseWheel>")
-
-    def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-    def refresh(self, query):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        tk.Label(
-            self.scrollable_frame,
-            text=f"Query: {query}",
-            font=("Arial", 16, "bold"),
-            bg="white",
-        ).pack(pady=10, anchor="w", padx=100)
+        # Result sections are created once and updated in place on refresh;
+        # rebuilding the matplotlib figures and canvases from scratch is the
+        # dominant cost of re-rendering this frame.
+        self.query_label = tk.Label(
+            self.scrollable_frame, text="", font=("Arial", 16, "bold"), bg="white"
+        )
+        self.query_label.pack(pady=10, anchor="w", padx=100)
 
-        tk.Label(
+        self.loading_label = tk.Label(
             self.scrollable_frame,
             text="Loading data...",
             bg="white",
             font=("Arial", 12, "italic"),
-        ).pack(anchor="w", padx=100)
+        )
 
-        threading.Thread(target=self._load_data, args=(query,), daemon=True).start()
+        self.salary_section = tk.Frame(self.scrollable_frame, bg="white")
+        self.hist_section = tk.Frame(self.scrollable_frame, bg="white")
+        self.skills_section = tk.Frame(self.scrollable_frame, bg="white")
+        self.regions_section = tk.Frame(self.scrollable_frame, bg="white")
+        for section in (
+            self.salary_section,
+            self.hist_section,
+            self.skills_section,
+            self.regions_section,
+        ):
+            section.pack(fill="x", anchor="w")
+
+        self.salary_value_label = None
+        self.error_label = None
+
+        # Figures, axes, and canvases are created lazily on first display
+        # and then reused across refreshes.
+        self._hist_fig = None
+        self._hist_ax = None
+        self._hist_canvas = None
+        self._hist_bars = None
+
+        self._skills_list = None
+        self._skill_labels = []
+        self._skills_fig = None
+        self._skills_ax = None
+        self._skills_canvas = None
+
+        self._regions_list = None
+        self._region_labels = []
+        self._regions_fig = None
+        self._regions_ax = None
+        self._regions_canvas = None
+
+        # Signals the in-flight loader thread to stop when a new query starts.
+        self._cancel = threading.Event()
 
-    def _load_data(self, query):
-        try:
-            vacancies = search_vacancies(query)
-            skills = da.get_top_skills(vacancies)
-            regions = da.get_top_regions(vacancies, get_top_regions_count())
-            salary = da.get_salary_statistics(vacancies)
-            salary_distribution = da.get_salary_distribution(vacancies)
+    def _on_mousewheel(self, event):
+        # Only scroll when the pointer is inside the results canvas subtree;
+        # the binding is global, so it also fires over the other frames.
+        widget = self.winfo_containing(event.x_root, event.y_root)
+        while widget is not None and widget is not self.canvas:
+            widget = widget.master
+        if widget is None:
+            return
 
+        if event.num == 4:
+            self.canvas.yview_scroll(-1, "units")
+        elif event.num == 5:
+            self.canvas.yview_scroll(1, "units")
+        else:
+            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def refresh(self, query):
+        """
+        Show the loading state and initiate background data loading
+        for the given job title query; result widgets are reused.
+        """
+        self.query = query
+        self.query_label.config(text=f"Query: {query}")
+        if self.error_label is not None:
+            self.error_label.pack_forget()
+        # The widgets are reused, and the new skill fetch can take many
+        # seconds; hide the section so the previous query's skills aren't
+        # shown as this query's result while it loads.
+        self.skills_section.pack_forget()
+        self.loading_label.pack(anchor="w", padx=100, after=self.query_label)
+
+        self._cancel.set()
+        self._cancel = threading.Event()
+        threading.Thread(
+            target=self._load_data, args=(query, self._cancel), daemon=True
+        ).start()
+
+    def _load_data(self, query, cancel):
+        """
+        Download vacancy data and calculate statistics in a background thread.
+
+        The cheap analyses (salary, distribution, regions) are plain walks
+        over the already-fetched JSON and are pushed to the UI immediately;
+        skill scraping, which needs one HTTP request per vacancy, continues
+        afterwards and fills in its section when done.
+        """
+        try:
+            salary, salary_dist, regions, vacancy_ids = da.analyze_vacancies(
+                search_vacancies(query), get_top_regions_count()
+            )
+            if cancel.is_set():
+                return
             self.scrollable_frame.after(
-                0, lambda: self._update_ui(salary, skills, regions, salary_distribution)
+                0, lambda: self._update_ui_fast(salary, salary_dist, regions)
             )
+
+            skills = da.get_top_skills(vacancy_ids, cancel=cancel)
+            if cancel.is_set():
+                return
+            self.scrollable_frame.after(0, lambda: self._display_skills(skills))
         except Exception as e:
-            self.scrollable_frame.after(
-                0,
-                lambda e=e: tk.Label(
-                    self.scrollable_frame,
-                    text=f"Error: {e}",
-                    fg="red",
-                    font=("Arial", 12),
-                ).pack(anchor="w", padx=100, pady=10),
+            if not cancel.is_set():
+                self.scrollable_frame.after(0, lambda e=e: self._show_error(e))
+
+    def _show_error(self, error):
+        """
+        Display the error label in place of the loading label.
+        """
+        self.loading_label.pack_forget()
+        # The reused sections still hold the previous query's results; hide
+        # them so the error isn't presented above stale data.
+        for section in (
+            self.salary_section,
+            self.hist_section,
+            self.skills_section,
+            self.regions_section,
+        ):
+            section.pack_forget()
+
+        if self.error_label is None:
+            self.error_label = tk.Label(
+                self.scrollable_frame,
+                text="",
+                fg="red",
+                font=("Arial", 12),
+                bg="white",
             )
+        self.error_label.config(text=f"Error: {error}")
+        self.error_label.pack(anchor="w", padx=100, pady=10, after=self.query_label)
 
-    def _update_ui(self, salary, skills, regions, salary_distribution):
-        self._display_salary(salary)
-        self._display_salary_histogram(salary_distribution)
-        self._display_skills(skills)
-        self._display_regions(regions)
+    def _update_ui_fast(self, salary, salary_dist, regions):
+        """
+        Render the cheap result sections as chained after_idle tasks so the
+        mainloop can process events between the matplotlib renders instead of
+        freezing for the whole redraw. The salary text appears immediately;
+        each chart is drawn in its own idle callback. The skills section is
+        rendered separately once scraping finishes.
+        """
+        self.loading_label.pack_forget()
+
+        # Re-show the sections in order in case an earlier error hid them;
+        # the skills section is re-packed separately when its data arrives.
+        for section in (self.salary_section, self.hist_section, self.regions_section):
+            if not section.winfo_manager():
+                section.pack(fill="x", anchor="w")
+
+        tasks = iter(
+            [
+                lambda: self._display_salary(salary),
+                lambda: self._display_salary_histogram(salary_dist),
+                lambda: self._display_regions(regions),
+            ]
+        )
+
+        def run_next():
+            task = next(tasks, None)
+            if task is None:
+                return
+            task()
+            self.after_idle(run_next)
+
+        run_next()
 
     def _display_salary(self, salary):
-        tk.Label(
-            self.scrollable_frame, text="Salary", font=("Arial", 14, "bold"), bg="white"
-        ).pack(pady=(10, 5), anchor="w", padx=100)
-        tk.Label(
-            self.scrollable_frame,
-            text=f"{round(salary, 2)} RUB",
-            font=("Arial", 18),
-            bg="white",
-            fg="green",
-        ).pack(pady=(0, 10), anchor="w", padx=100)
+        if self.salary_value_label is None:
+            tk.Label(
+                self.salary_section,
+                text="Salary",
+                font=("Arial", 14, "bold"),
+                bg="white",
+            ).pack(pady=(10, 5), anchor="w", padx=100)
+            self.salary_value_label = tk.Label(
+                self.salary_section,
+                text="",
+                font=("Arial", 18),
+                bg="white",
+                fg="green",
+            )
+            self.salary_value_label.pack(pady=(0, 10), anchor="w", padx=100)
+        self.salary_value_label.config(text=f"{round(salary, 2)} RUB")
 
-    def _display_salary_histogram(self, salaries):
-        if not salaries:
+    def _display_salary_histogram(self, salary_dist):
+        """
+        Display histogram of salary distribution, reusing the figure and canvas.
+        """
+        if not len(salary_dist):
+            # Hide the reused canvas so the previous query's histogram
+            # isn't presented as this query's result.
+            if self._hist_canvas is not None:
+                self._hist_canvas.get_tk_widget().pack_forget()
             return
+        counts, edges = np.histogram(salary_dist, bins=10)
 
-        tk.Label(
-            self.scrollable_frame,
-            text="Salary Distribution",
-            font=("Arial", 14, "bold"),
-            bg="white",
-        ).pack(pady=(10, 5), anchor="w", padx=100)
-
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.hist(salaries, bins=20, color="#4caf50", edgecolor="black")
-        ax.set_title("Salary Histogram")
-        ax.set_xlabel("Salary (RUB)")
-        ax.set_ylabel("Number of Vacancies")
-        fig.tight_layout()
+        if self._hist_fig is None:
+            self._hist_fig = Figure(figsize=(5, 3), dpi=100)
+            self._hist_ax = self._hist_fig.add_subplot(111)
+            self._hist_canvas = FigureCanvasTkAgg(
+                self._hist_fig, master=self.hist_section
+            )
 
-        canvas = FigureCanvasTkAgg(fig, master=self.scrollable_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=10, padx=100, anchor="w")
+        widget = self._hist_canvas.get_tk_widget()
+        if not widget.winfo_manager():
+            widget.pack(pady=10, padx=100, anchor="w")
+
+        ax = self._hist_ax
+        if self._hist_bars is None:
+            self._hist_bars = ax.bar(
+                edges[:-1],
+                counts,
+                width=np.diff(edges),
+                align="edge",
+                color="#009688",
+                edgecolor="black",
+            )
+            ax.set_title("Salary Distribution")
+            ax.set_xlabel("Salary")
+            ax.set_ylabel("Frequency")
+            self._hist_fig.tight_layout()
+        else:
+            # Update the existing bar artists instead of re-plotting.
+            widths = np.diff(edges)
+            for bar, count, left, width in zip(
+                self._hist_bars, counts, edges[:-1], widths
+            ):
+                bar.set_x(left)
+                bar.set_width(width)
+                bar.set_height(count)
+            ax.relim()
+            ax.autoscale_view()
+
+        self._hist_canvas.draw_idle()
 
     def _display_skills(self, skills):
-        tk.Label(
-            self.scrollable_frame, text="Skills", font=("Arial", 14, "bold"), bg="white"
-        ).pack(pady=(10, 5), anchor="w", padx=100)
-        for s, c in skills:
+        if not skills:
+            # No skills for this query; keep the section hidden rather than
+            # rendering an empty list and chart.
+            return
+
+        if self._skills_fig is None:
             tk.Label(
-                self.scrollable_frame,
+                self.skills_section,
+                text="Skills",
+                font=("Arial", 14, "bold"),
+                bg="white",
+            ).pack(pady=(10, 5), anchor="w", padx=100)
+            self._skills_list = tk.Frame(self.skills_section, bg="white")
+            self._skills_list.pack(fill="x", anchor="w")
+            self._skills_fig = Figure(figsize=(5, 3), dpi=100)
+            self._skills_ax = self._skills_fig.add_subplot(111)
+            self._skills_canvas = FigureCanvasTkAgg(
+                self._skills_fig, master=self.skills_section
+            )
+            self._skills_canvas.get_tk_widget().pack(pady=10, padx=100, anchor="w")
+
+        if not self.skills_section.winfo_manager():
+            self.skills_section.pack(
+                fill="x", anchor="w", before=self.regions_section
+            )
+
+        for label in self._skill_labels:
+            label.destroy()
+        self._skill_labels = []
+        for s, c in skills:
+            label = tk.Label(
+                self._skills_list,
                 text=f"• {s}: {c}",
                 anchor="w",
                 bg="white",
                 font=("Arial", 12),
-            ).pack(fill="x", padx=120)
+            )
+            label.pack(fill="x", padx=120)
+            self._skill_labels.append(label)
 
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
+        ax = self._skills_ax
+        ax.clear()
         ax.barh(
             [s for s, _ in reversed(skills)],
             [c for _, c in reversed(skills)],
@@ -390,30 +576,42 @@ class ResultFrame(tk.Frame):
         )
         ax.set_xlabel("Frequency")
         ax.set_title("Top Skills")
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.scrollable_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=10, padx=100, anchor="w")
+        self._skills_fig.tight_layout()
+        self._skills_canvas.draw_idle()
 
     def _display_regions(self, regions):
-        tk.Label(
-            self.scrollable_frame,
-            text="Regions",
-            font=("Arial", 14, "bold"),
-            bg="white",
-        ).pack(pady=(10, 5), anchor="w", padx=100)
-        for r, c in regions:
+        if self._regions_fig is None:
             tk.Label(
-                self.scrollable_frame,
+                self.regions_section,
+                text="Regions",
+                font=("Arial", 14, "bold"),
+                bg="white",
+            ).pack(pady=(10, 5), anchor="w", padx=100)
+            self._regions_list = tk.Frame(self.regions_section, bg="white")
+            self._regions_list.pack(fill="x", anchor="w")
+            self._regions_fig = Figure(figsize=(5, 3), dpi=100)
+            self._regions_ax = self._regions_fig.add_subplot(111)
+            self._regions_canvas = FigureCanvasTkAgg(
+                self._regions_fig, master=self.regions_section
+            )
+            self._regions_canvas.get_tk_widget().pack(pady=10, padx=100, anchor="w")
+
+        for label in self._region_labels:
+            label.destroy()
+        self._region_labels = []
+        for r, c in regions:
+            label = tk.Label(
+                self._regions_list,
                 text=f"• {r}: {c}",
                 anchor="w",
                 bg="white",
                 font=("Arial", 12),
-            ).pack(fill="x", padx=120)
+            )
+            label.pack(fill="x", padx=120)
+            self._region_labels.append(label)
 
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
+        ax = self._regions_ax
+        ax.clear()
         ax.barh(
             [r for r, _ in reversed(regions)],
             [c for _, c in reversed(regions)],
@@ -421,93 +619,8 @@ class ResultFrame(tk.Frame):
         )
         ax.set_xlabel("Count")
         ax.set_title("Top Regions")
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.scrollable_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=10, padx=100, anchor="w")
-
-    def refresh(self, query):
-        """
-        Clear previous widgets and initiate background data loading
-        for the given job title query.
-        """
-        self.query = query
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        self.query_label = tk.Label(
-            self.scrollable_frame,
-            text=f"Query: {query}",
-            font=("Arial", 16, "bold"),
-            bg="white",
-        )
-        self.query_label.pack(pady=10, anchor="w", padx=100)
-
-        self.loading_label = tk.Label(
-            self.scrollable_frame,
-            text="Loading data...",
-            bg="white",
-            font=("Arial", 12, "italic"),
-        )
-        self.loading_label.pack(anchor="w", padx=100)
-
-        threading.Thread(target=self._load_data, args=(query,), daemon=True).start()
-
-    def _load_data(self, query):
-        """
-        Download vacancy data and calculate statistics in a background thread.
-        """
-        try:
-            vacancies = search_vacancies(query)
-            skills = da.get_top_skills(vacancies)
-            regions = da.get_top_regions(vacancies, get_top_regions_count())
-            salary = da.get_salary_statistics(vacancies)
-            salary_dist = da.get_salary_distribution(vacancies)
-
-            self.scrollable_frame.after(
-                0, lambda: self._update_ui(salary, salary_dist, skills, regions)
-            )
-        except Exception as e:
-            self.scrollable_frame.after(
-                0,
-                lambda e=e: tk.Label(
-                    self.scrollable_frame,
-                    text=f"Error: {e}",
-                    fg="red",
-                    font=("Arial", 12),
-                ).pack(anchor="w", padx=100, pady=10),
-            )
-
-    def _update_ui(self, salary, salary_dist, skills, regions):
-        """
-        Render all UI sections: salary, skills, regions after removing loading label.
-        """
-        if hasattr(self, "loading_label") and self.loading_label:
-            self.loading_label.destroy()
-
-        self._display_salary(salary)
-        self._display_salary_histogram(salary_dist)
-        self._display_skills(skills)
-        self._display_regions(regions)
-
-    def _display_salary_histogram(self, salary_dist):
-        """
-        Display histogram of salary distribution.
-        """
-        if not salary_dist:
-            return
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.hist(salary_dist, bins=10, color="#009688", edgecolor="black")
-        ax.set_title("Salary Distribution")
-        ax.set_xlabel("Salary")
-        ax.set_ylabel("Frequency")
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.scrollable_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=10, padx=100, anchor="w")
+        self._regions_fig.tight_layout()
+        self._regions_canvas.draw_idle()
 
 
 if __name__ == "__main__":
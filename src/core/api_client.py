@@ -5,43 +5,82 @@ for retrieving job vacancy data and generating suggestions
 based on job titles.
 """
 
-import time
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from src.settings.constants import BASE_URL
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.settings.config import get_max_results_per_request
 
-
-def get_vacancy_skills(url: str) -> list[str]:
+# Shared session so all API calls reuse keep-alive connections instead of
+# paying a TCP+TLS handshake per request; failed requests are retried with
+# exponential backoff. Responses are cached on disk for an hour, so
+# repeating a query (or restarting the app) reuses vacancy-detail and
+# exchange-rate payloads without hitting the network.
+_session = requests_cache.CachedSession(
+    cache_name=".cache/hh_http", backend="sqlite", expire_after=3600
+)
+_session.headers.update(
+    {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+)
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
+def get_vacancy_skills_by_id(vacancy_id: str) -> list[str]:
     """
-    Returns a list of key skills from a vacancy page on hh.ru by its URL.
+    Returns a list of key skills for a vacancy via the HH.ru JSON API.
+
+    The vacancy endpoint exposes key_skills directly, so there is no HTML
+    page to download and parse.
 
     Args:
-        url (str): The URL of the hh.ru vacancy page.
+        vacancy_id (str): The vacancy identifier from search results.
 
     Returns:
-        list: A list of key skills found in the vacancy description.
+        list: A list of key skill names listed on the vacancy.
 
     Raises:
-        ValueError: If there is an error loading the page (e.g., a non-200 HTTP response).
+        requests.HTTPError: If the vacancy request fails.
     """
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+    response = _session.get(f"{BASE_URL}/vacancies/{vacancy_id}")
+    response.raise_for_status()
+    data = orjson.loads(response.content)
 
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        raise ValueError(f"Error loading page: {response.status_code}")
+    return [skill["name"] for skill in data.get("key_skills", [])]
 
-    soup = BeautifulSoup(response.text, "html.parser")
 
-    skills_elements = soup.find_all("li", attrs={"data-qa": "skills-element"})
+@functools.lru_cache(maxsize=1)
+def _get_all_rates() -> dict:
+    """
+    Fetches and caches the full exchange-rate table.
 
-    return [el.get_text(strip=True) for el in skills_elements]
+    Returns:
+        dict: Mapping of currency codes to their rates against USD.
+    """
+    url = "https://api.exchangerate-api.com/v4/latest/USD"
+    response = _session.get(url)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    return data["rates"]
 
 
 def get_exchange_rate(currency: str = "RUR") -> float:
     """
     Fetches the exchange rate to RUB for the specified currency.
 
+    The rates table is downloaded once and cached, so repeated calls
+    (one per vacancy during salary calculation) are plain dict lookups.
+
     Args:
         currency (str): Currency code (e.g., "USD", "EUR"). Default is "RUR" (for Rubles).
 
@@ -51,13 +90,9 @@ def get_exchange_rate(currency: str = "RUR") -> float:
     if currency == "RUR":
         return 1.0
 
-    url = f"https://api.exchangerate-api.com/v4/latest/USD"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
-
-    if currency in data["rates"]:
-        return data["rates"][currency]
+    rates = _get_all_rates()
+    if currency in rates:
+        return rates[currency]
     else:
         raise ValueError(f"Currency {currency} not found in exchange rates.")
 
@@ -82,40 +117,54 @@ def convert_salary_to_rub(salary_value: float, currency: str) -> float:
     return salary_value / exchange_rate
 
 
-def search_vacancies(query: str, per_page: int = 50) -> list:
+def search_vacancies(query: str, per_page: int = 50):
     """
     Searches for job vacancies on HH.ru based on the query, searching only in the description.
 
+    Vacancies are yielded as pages arrive instead of being accumulated in a
+    list, so a single-pass consumer never holds more than one page of raw
+    API items beyond what it keeps itself.
+
     Args:
         query (str): The job title or keyword to search for.
         per_page (int): The number of results per page (max 100).
 
-    Returns:
-        list: A list of job vacancies matching the query.
+    Yields:
+        dict: Job vacancies matching the query, up to the configured limit.
     """
     total_vacancies = get_max_results_per_request()
-    all_vacancies = []
-    page = 0
-    while len(all_vacancies) < total_vacancies:
-        url = f"{BASE_URL}/vacancies"
+    url = f"{BASE_URL}/vacancies"
+
+    def fetch_page(page: int) -> dict:
         params = {
             "text": query,
             "per_page": per_page,
             "page": page,
             "search_field": "name",
         }
-
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
-
-        vacancies = data.get("items", [])
-        all_vacancies.extend(vacancies)
-
-        if len(all_vacancies) >= total_vacancies or not data.get("pages", 1) > page:
-            break
-
-        page += 1
-        time.sleep(1)
-
-    return all_vacancies[:total_vacancies]
+        return orjson.loads(response.content)
+
+    # Probe the first page to learn how many pages exist, then fetch the
+    # remaining pages concurrently instead of one per second.
+    data = fetch_page(0)
+    yielded = 0
+    for vacancy in data.get("items", []):
+        if yielded >= total_vacancies:
+            return
+        yield vacancy
+        yielded += 1
+
+    needed_pages = min(data.get("pages", 1), math.ceil(total_vacancies / per_page))
+    if needed_pages > 1:
+        executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            for page_data in executor.map(fetch_page, range(1, needed_pages)):
+                for vacancy in page_data.get("items", []):
+                    if yielded >= total_vacancies:
+                        return
+                    yield vacancy
+                    yielded += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
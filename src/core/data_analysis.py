@@ -2,16 +2,21 @@ import numpy as np
 from src.settings.config import get_salary_calculation_method
 from src.core.api_client import convert_salary_to_rub
 from collections import Counter
-from src.core.api_client import get_vacancy_skills
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nlargest
+from src.core.api_client import get_vacancy_skills_by_id
 from src.settings.config import get_top_skills_count
 
 
-def get_top_skills(vacancies: list) -> list:
+def get_top_skills(vacancy_ids: list, cancel=None) -> list:
     """
     Get the top X most common skills across a list of vacancies.
 
     Args:
-        vacancies (list): List of job vacancies (already retrieved).
+        vacancy_ids (list): Ids of the vacancies to look up, as collected
+            during the analysis pass.
+        cancel (threading.Event, optional): When set, stop fetching further
+            vacancies and return the skills counted so far.
 
     Returns:
         list: A list of tuples with the skill and its frequency, sorted by popularity.
@@ -19,14 +24,19 @@ def get_top_skills(vacancies: list) -> list:
     top_x = get_top_skills_count()
 
     all_skills = []
-
-    for vacancy in vacancies:
-        skills = get_vacancy_skills(vacancy["alternate_url"])
-        all_skills.extend(skills)
+    executor = ThreadPoolExecutor(max_workers=16)
+    try:
+        for skills in executor.map(get_vacancy_skills_by_id, vacancy_ids):
+            if cancel is not None and cancel.is_set():
+                break
+            all_skills.extend(skills)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     skills_counter = Counter(all_skills)
 
-    return skills_counter.most_common(top_x)
+    # nlargest is O(n log k) vs the full O(n log n) sort in most_common.
+    return nlargest(top_x, skills_counter.items(), key=lambda kv: kv[1])
 
 
 def get_top_regions(vacancies: list, top_x: int) -> list:
@@ -46,7 +56,7 @@ def get_top_regions(vacancies: list, top_x: int) -> list:
         if vacancy.get("area")
     ]
     region_counts = Counter(regions)
-    return region_counts.most_common(top_x)
+    return nlargest(top_x, region_counts.items(), key=lambda kv: kv[1])
 
 
 def calculate_salary(vacancies: list, method: str = None) -> float:
@@ -60,30 +70,41 @@ def calculate_salary(vacancies: list, method: str = None) -> float:
     Returns:
         float: The calculated salary (average or median).
     """
-    salary_values = []
+    triples = [
+        (salary.get("from"), salary.get("to"), salary.get("currency", "RUR"))
+        for vacancy in vacancies
+        for salary in (vacancy.get("salary"),)
+        if salary
+    ]
 
-    for vacancy in vacancies:
-        salary = vacancy.get("salary")
-        if not salary:
-            continue
+    if not triples:
+        return 0
 
-        salary_from = salary.get("from")
-        salary_to = salary.get("to")
-        currency = salary.get("currency", "RUR")
-
-        if salary_from is not None and salary_to is None:
-            salary_values.append(convert_salary_to_rub(salary_from, currency))
-        elif salary_to is not None and salary_from is None:
-            salary_values.append(
-                convert_salary_to_rub(salary_to, currency)
-            )
-        elif salary_from is not None and salary_to is not None:
-            avg_salary = (salary_from + salary_to) / 2
-            salary_values.append(convert_salary_to_rub(avg_salary, currency))
-
-    if not salary_values:
+    salary_from = np.array(
+        [np.nan if f is None else f for f, _, _ in triples], dtype=np.float64
+    )
+    salary_to = np.array(
+        [np.nan if t is None else t for _, t, _ in triples], dtype=np.float64
+    )
+    currencies = np.array([c for _, _, c in triples], dtype=object)
+
+    salary_values = np.where(
+        np.isnan(salary_from),
+        salary_to,
+        np.where(np.isnan(salary_to), salary_from, (salary_from + salary_to) / 2),
+    )
+
+    known = ~np.isnan(salary_values)
+    salary_values = salary_values[known]
+    currencies = currencies[known]
+
+    if salary_values.size == 0:
         return 0
 
+    # Scale each currency bucket at once instead of converting per vacancy.
+    for currency in np.unique(currencies):
+        salary_values[currencies == currency] *= convert_salary_to_rub(1.0, currency)
+
     if method == "average":
         return np.mean(salary_values)
     elif method == "median":
@@ -109,21 +130,86 @@ def get_salary_statistics(vacancies: list) -> float:
     return stat_salary
 
 
-def get_salary_distribution(vacancies: list) -> list:
+def analyze_vacancies(vacancies, top_regions_x: int) -> tuple:
     """
-    Extract a list of salary values from vacancies for distribution analysis.
+    Walk a vacancy stream once and compute every cheap analysis together.
 
-    :param vacancies: List of vacancy dictionaries.
-    :return: List of float salary values.
+    Accepts any iterable (including the search_vacancies generator) and, in
+    a single pass, collects the RUB-converted salary distribution, the
+    region frequencies, and the vacancy ids needed for the later skill
+    lookup. The configured salary statistic (average or median) is then
+    derived from the collected distribution.
+
+    Args:
+        vacancies: Iterable of vacancy dictionaries.
+        top_regions_x (int): The number of top regions to return.
+
+    Returns:
+        tuple: (salary statistic, salary distribution list,
+        top regions list, vacancy id list).
     """
     salaries = []
+    region_counts = Counter()
+    vacancy_ids = []
+
     for vacancy in vacancies:
+        vacancy_ids.append(vacancy["id"])
+
+        area = vacancy.get("area")
+        if area:
+            region_counts[area.get("name")] += 1
+
         salary = vacancy.get("salary")
-        if salary and salary.get("from") and salary.get("to"):
-            average = (salary["from"] + salary["to"]) / 2
-            salaries.append(average)
-        elif salary and salary.get("from"):
-            salaries.append(salary["from"])
-        elif salary and salary.get("to"):
-            salaries.append(salary["to"])
-    return salaries
+        if not salary:
+            continue
+
+        salary_from = salary.get("from")
+        salary_to = salary.get("to")
+
+        if salary_from and salary_to:
+            value = (salary_from + salary_to) / 2
+        elif salary_from or salary_to:
+            value = salary_from or salary_to
+        else:
+            continue
+
+        salaries.append(convert_salary_to_rub(value, salary.get("currency", "RUR")))
+
+    regions = nlargest(top_regions_x, region_counts.items(), key=lambda kv: kv[1])
+
+    if not salaries:
+        return 0, salaries, regions, vacancy_ids
+
+    method = get_salary_calculation_method()
+    if method == "average":
+        stat_salary = float(np.mean(salaries))
+    elif method == "median":
+        stat_salary = float(np.median(salaries))
+    else:
+        raise ValueError("Invalid calculation method: choose 'average' or 'median'.")
+
+    return stat_salary, salaries, regions, vacancy_ids
+
+
+def get_salary_distribution(vacancies: list) -> np.ndarray:
+    """
+    Extract salary values from vacancies for distribution analysis.
+
+    Built as a single generator expression fed into np.fromiter, so the
+    per-vacancy dict lookups happen once and the result lands directly in a
+    float64 array that downstream histogramming can consume as-is.
+
+    :param vacancies: List of vacancy dictionaries.
+    :return: Array of float salary values.
+    """
+    return np.fromiter(
+        (
+            (salary["from"] + salary["to"]) / 2
+            if salary.get("from") and salary.get("to")
+            else (salary.get("from") or salary.get("to"))
+            for vacancy in vacancies
+            for salary in (vacancy.get("salary"),)
+            if salary and (salary.get("from") or salary.get("to"))
+        ),
+        dtype=np.float64,
+    )
@@ -1,92 +1,117 @@
 import os
-import json
+import orjson
+from dataclasses import dataclass, asdict
 
 CONFIG_FILE = os.path.join("src", "settings", "config.json")
 
 
-def load_config():
-    """Load configuration from the config.json file."""
-    if not os.path.exists(CONFIG_FILE):
-        save_config(
-            {
-                "window_size": (600, 400),
-                "salary_calculation_method": "average",
-                "max_results_per_request": 50,
-                "top_skills_count": 5,
-                "top_regions_count": 5,
-            }
-        )
+@dataclass
+class Settings:
+    """Typed application settings backed by config.json."""
 
-    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    window_size: tuple = (600, 400)
+    salary_calculation_method: str = "average"
+    max_results_per_request: int = 50
+    top_skills_count: int = 5
+    top_regions_count: int = 5
 
+    @classmethod
+    def load(cls):
+        """Load settings from config.json, creating it with defaults if missing."""
+        if not os.path.exists(CONFIG_FILE):
+            settings = cls()
+            settings.save()
+            return settings
 
-def save_config(config):
-    """Save configuration to the config.json file."""
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, ensure_ascii=False, indent=2)
+        with open(CONFIG_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        if "window_size" in known:
+            known["window_size"] = tuple(known["window_size"])
+        return cls(**known)
+
+    def save(self):
+        """Write settings to config.json in a single JSON dump."""
+        global _SETTINGS_MTIME
+        with open(CONFIG_FILE, "wb") as f:
+            f.write(orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2))
+        _SETTINGS_MTIME = os.stat(CONFIG_FILE).st_mtime
+
+
+# Singleton settings instance, keyed by the file's mtime so that external
+# edits to config.json are still picked up.
+_SETTINGS = None
+_SETTINGS_MTIME = None
+
+
+def get_settings() -> Settings:
+    """Return the cached Settings instance, reloading if the file changed."""
+    global _SETTINGS, _SETTINGS_MTIME
+
+    mtime = os.stat(CONFIG_FILE).st_mtime if os.path.exists(CONFIG_FILE) else None
+    if _SETTINGS is None or mtime != _SETTINGS_MTIME:
+        _SETTINGS = Settings.load()
+        _SETTINGS_MTIME = os.stat(CONFIG_FILE).st_mtime
+
+    return _SETTINGS
 
 
 def get_window_size():
     """Get the window size configuration."""
-    config = load_config()
-    return config.get("window_size", (600, 400))
+    return get_settings().window_size
 
 
 def set_window_size(width, height):
     """Set the window size in the configuration."""
-    config = load_config()
-    config["window_size"] = (width, height)
-    save_config(config)
+    settings = get_settings()
+    settings.window_size = (width, height)
+    settings.save()
 
 
 def get_salary_calculation_method():
     """Get the salary calculation method from the configuration."""
-    config = load_config()
-    return config.get("salary_calculation_method", "average")
+    return get_settings().salary_calculation_method
 
 
 def set_salary_calculation_method(method):
     """Set the salary calculation method in the configuration."""
-    config = load_config()
-    config["salary_calculation_method"] = method
-    save_config(config)
+    settings = get_settings()
+    settings.salary_calculation_method = method
+    settings.save()
 
 
 def get_max_results_per_request():
     """Get the maximum number of results per request."""
-    config = load_config()
-    return config.get("max_results_per_request", 50)
+    return get_settings().max_results_per_request
 
 
 def set_max_results_per_request(count):
     """Set the maximum number of results per request in the configuration."""
-    config = load_config()
-    config["max_results_per_request"] = count
-    save_config(config)
+    settings = get_settings()
+    settings.max_results_per_request = count
+    settings.save()
 
 
 def get_top_skills_count():
     """Get the number of top skills to return."""
-    config = load_config()
-    return config.get("top_skills_count", 5)
+    return get_settings().top_skills_count
 
 
 def set_top_skills_count(count):
     """Set the number of top skills to return in the configuration."""
-    config = load_config()
-    config["top_skills_count"] = count
-    save_config(config)
+    settings = get_settings()
+    settings.top_skills_count = count
+    settings.save()
 
 
 def get_top_regions_count():
     """Get the number of top regions to return."""
-    config = load_config()
-    return config.get("top_regions_count", 5)
+    return get_settings().top_regions_count
 
 
 def set_top_regions_count(count):
     """Set the number of top regions to return in the configuration."""
-    config = load_config()
-    config["top_regions_count"] = count
-    save_config(config)
+    settings = get_settings()
+    settings.top_regions_count = count
+    settings.save()